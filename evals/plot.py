@@ -27,9 +27,7 @@ def main():
     )
 
     # Get the latest entry for each model
-    latest_df = df.group_by('model').agg(
-        pl.all().sort_by('date').last()
-    )
+    latest_df = df.sort('date').unique(subset=['model'], keep='last', maintain_order=True)
 
     # Convert accuracy to percentage
     latest_df = latest_df.with_columns(